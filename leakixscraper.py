@@ -1,14 +1,119 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import json
+from requests.adapters import HTTPAdapter, Retry
+import aiohttp
+import lxml.etree
+import lxml.html
+from selectolax.lexbor import LexborHTMLParser
+
+# Rust-backed batch HTTP client (reqwest/tokio); binary wheels are
+# platform-specific, so fall back to the aiohttp path without it
+try:
+    import rusty_req
+except ImportError:
+    rusty_req = None
+import csv
+import orjson
 import time
-import random
 import argparse
-from urllib.parse import urljoin
-from typing import List, Dict, Any, Optional
+import asyncio
+import threading
+from urllib.parse import quote, urljoin, urlsplit
+from typing import BinaryIO, Iterable, List, Dict, Any, Optional, Tuple
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_sec: float):
+        """Initialize a token-bucket rate limiter.
+
+        Args:
+            capacity: Maximum number of tokens (allowed burst size)
+            refill_per_sec: Steady-state token refill rate per second
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available.
+
+        Safe to call from multiple threads; concurrent fetchers share the
+        same steady request rate toward the host.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.last_refill) * self.refill_per_sec)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.refill_per_sec
+
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Take one token, awaiting until one is available.
+
+        Same accounting as acquire(), but waits with asyncio.sleep so the
+        event loop keeps running other fetches.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.last_refill) * self.refill_per_sec)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.refill_per_sec
+
+            await asyncio.sleep(wait)
+
 
 class WebsiteScraper:
+    # XPath expressions compiled once at class load and shared by every
+    # result/detail iteration, so expression parsing isn't repeated per item.
+    # These expressions are examples - adjust based on actual HTML structure.
+    _X_RESULTS = lxml.etree.XPath(
+        '//div[contains(concat(" ", normalize-space(@class), " "), " search-result ")]')
+    _X_RESULT_TITLE = lxml.etree.XPath('string(.//h4[contains(@class, "result-title")])')
+    _X_RESULT_DESC = lxml.etree.XPath('string(.//div[contains(@class, "result-description")])')
+    _X_RESULT_HREF = lxml.etree.XPath('string(.//a/@href)')
+    _X_DETAIL_ITEMS = lxml.etree.XPath('.//div[contains(@class, "detail-item")]')
+    _X_DETAIL_KEY = lxml.etree.XPath('string(.//span[contains(@class, "detail-key")])')
+    _X_DETAIL_VALUE = lxml.etree.XPath('string(.//span[contains(@class, "detail-value")])')
+    _X_SERVICE_TITLE = lxml.etree.XPath('string(//h1[contains(@class, "service-title")])')
+    _X_INFO_CELLS = lxml.etree.XPath('//table[contains(@class, "info-table")]//tr[td[2]]/td[position() <= 2]')
+
+    # Shared request timeout; aiohttp accepts one object for all calls
+    _TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+    # Parser for bodies known to be UTF-8 (e.g. re-encoded from an already
+    # decoded string); skips libxml2's per-page charset sniffing, which
+    # falls back to latin-1 when no charset is declared
+    _UTF8_HTML = lxml.html.HTMLParser(encoding='utf-8')
+
+    @classmethod
+    def _html_parser_for(cls, encoding: str) -> lxml.html.HTMLParser:
+        """Return an HTML parser fixed to a response's resolved encoding.
+
+        Args:
+            encoding: Encoding resolved from the response headers
+
+        Returns:
+            HTMLParser decoding with that encoding
+        """
+        if encoding.lower() in ('utf-8', 'utf8'):
+            return cls._UTF8_HTML
+        return lxml.html.HTMLParser(encoding=encoding)
+
     def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None):
         """Initialize the website scraper.
         
@@ -20,44 +125,156 @@ class WebsiteScraper:
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            # brotli is ~20% smaller than gzip; urllib3 and aiohttp
+            # decompress all three in C with the brotli package installed
+            'Accept-Encoding': 'br, gzip, deflate',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
         self.session = requests.Session()
-        
-    def get_page(self, url: str, retry_count: int = 3) -> Optional[BeautifulSoup]:
+        # Keep enough pooled keep-alive sockets for concurrent page fetches,
+        # and let urllib3 handle transient-error retries with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # One bucket per host: steady 1 req/sec with a burst of 3, so the
+        # concurrent fetcher stays within politeness limits
+        self.bucket = TokenBucket(capacity=3, refill_per_sec=1)
+        # Precomputed scheme://netloc for the href fast path in _absolute_url
+        base_parsed = urlsplit(base_url)
+        self._origin = f"{base_parsed.scheme}://{base_parsed.netloc}"
+
+    def _absolute_url(self, href: str) -> str:
+        """Resolve an href against the base URL.
+
+        Fast paths for site-relative and already-absolute hrefs skip
+        urljoin, which re-parses both URLs on every call; anything else
+        falls back to it.
+
+        Args:
+            href: The href attribute value to resolve
+
+        Returns:
+            Absolute URL
+        """
+        if href.startswith('/'):
+            return self._origin + href
+        if href.startswith(('http://', 'https://')):
+            return href
+        return urljoin(self.base_url, href)
+
+    @staticmethod
+    def _parse_html(content: bytes) -> LexborHTMLParser:
+        """Parse raw HTML bytes into a selectolax tree.
+
+        Lexbor parses and matches CSS selectors entirely in C, so both
+        tree construction and the .css/.css_first calls on the result stay
+        off the Python interpreter. Passing raw bytes lets the parser
+        handle encoding detection.
+
+        Args:
+            content: Raw HTML bytes
+
+        Returns:
+            LexborHTMLParser tree of the parsed page
+        """
+        return LexborHTMLParser(content)
+
+    def get_content(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Get the raw body of a page and its resolved encoding.
+
+        Retries on transient errors are handled by the session's mounted
+        HTTPAdapter, so a single request here may retry inside urllib3.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Tuple of raw response bytes and encoding, or None on failure
+        """
+        full_url = urljoin(self.base_url, url)
+
+        try:
+            self.bucket.acquire()
+            print(f"Fetching {full_url}...")
+            response = self.session.get(full_url, headers=self.headers, timeout=10)
+
+            if response.status_code == 200:
+                # requests reports ISO-8859-1 for text/* without a declared
+                # charset (RFC 2616 default); treat undeclared as UTF-8
+                content_type = response.headers.get('Content-Type', '')
+                encoding = response.encoding if 'charset=' in content_type else None
+                return response.content, encoding or 'utf-8'
+            else:
+                print(f"Failed to fetch {full_url}, status code: {response.status_code}")
+
+        except requests.RequestException as e:
+            print(f"Error fetching {full_url}: {e}")
+
+        return None
+
+    def get_page(self, url: str) -> Optional[LexborHTMLParser]:
         """Get and parse a page.
-        
+
         Args:
             url: The URL to fetch
-            retry_count: Number of retries on failure
-            
+
         Returns:
-            BeautifulSoup object of the parsed page, or None on failure
+            LexborHTMLParser tree of the parsed page, or None on failure
+        """
+        fetched = self.get_content(url)
+        return self._parse_html(fetched[0]) if fetched else None
+
+    async def aget_content(self, session: aiohttp.ClientSession,
+                           url: str) -> Optional[Tuple[bytes, str]]:
+        """Get the raw body of a page and its resolved encoding.
+
+        Async variant of get_content; hundreds of fetches can be in flight
+        on one thread while each awaits its response.
+
+        Args:
+            session: Shared aiohttp client session
+            url: The URL to fetch
+
+        Returns:
+            Tuple of raw response bytes and encoding, or None on failure
         """
         full_url = urljoin(self.base_url, url)
-        
-        for attempt in range(retry_count):
-            try:
-                print(f"Fetching {full_url}...")
-                response = self.session.get(full_url, headers=self.headers, timeout=10)
-                
-                if response.status_code == 200:
-                    return BeautifulSoup(response.text, 'html.parser')
+
+        try:
+            await self.bucket.acquire_async()
+            print(f"Fetching {full_url}...")
+            async with session.get(full_url, headers=self.headers,
+                                   timeout=self._TIMEOUT) as response:
+                if response.status == 200:
+                    content = await response.read()
+                    return content, response.get_encoding()
                 else:
-                    print(f"Failed to fetch {full_url}, status code: {response.status_code}")
-                    
-            except requests.RequestException as e:
-                print(f"Error fetching {full_url}: {e}")
-                
-            # Wait before retrying with exponential backoff
-            if attempt < retry_count - 1:
-                sleep_time = 2 ** attempt + random.uniform(0, 1)
-                print(f"Retrying in {sleep_time:.2f} seconds...")
-                time.sleep(sleep_time)
-                
+                    print(f"Failed to fetch {full_url}, status code: {response.status}")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching {full_url}: {e}")
+
         return None
+
+    async def aget_page(self, session: aiohttp.ClientSession, url: str) -> Optional[LexborHTMLParser]:
+        """Get and parse a page on the shared aiohttp session.
+
+        Args:
+            session: Shared aiohttp client session
+            url: The URL to fetch
+
+        Returns:
+            LexborHTMLParser tree of the parsed page, or None on failure
+        """
+        fetched = await self.aget_content(session, url)
+        return self._parse_html(fetched[0]) if fetched else None
         
     def scrape_leakix_homepage(self) -> List[Dict[str, Any]]:
         """Scrape the LeakIX homepage for leaked services.
@@ -65,110 +282,418 @@ class WebsiteScraper:
         Returns:
             List of dictionaries containing information about leaked services
         """
-        soup = self.get_page("/")
-        if not soup:
+        tree = self.get_page("/")
+        if not tree:
             return []
-            
+
         results = []
-        
+
         # Example: Find the service cards on LeakIX homepage
-        service_cards = soup.select('div.card')  # Adjust selector based on actual HTML structure
-        
+        # These selectors are examples - adjust based on actual HTML structure
+        service_cards = tree.css('div.card')
+
         for card in service_cards:
             try:
-                # These selectors are examples - you'll need to adjust based on actual HTML
-                service_data = {
-                    'title': card.select_one('h3.card-title').text.strip() if card.select_one('h3.card-title') else "N/A",
-                    'description': card.select_one('p.card-text').text.strip() if card.select_one('p.card-text') else "N/A",
-                    'url': urljoin(self.base_url, card.select_one('a')['href']) if card.select_one('a') else None,
-                    'timestamp': card.select_one('span.date').text.strip() if card.select_one('span.date') else "N/A",
-                }
-                
-                results.append(service_data)
-                
+                results.append(self._extract_card(card))
+
             except Exception as e:
                 print(f"Error parsing card: {e}")
-                
+
         return results
+
+    def _extract_card(self, card) -> Dict[str, Any]:
+        """Extract one service card in a single subtree walk.
+
+        All four fields are picked up in one depth-first pass over the
+        card's nodes instead of a separate selector descent per field, so
+        each node is visited exactly once.
+
+        Args:
+            card: The service card node
+
+        Returns:
+            Dictionary containing information about the leaked service
+        """
+        title = description = url = timestamp = None
+
+        for node in card.traverse():
+            tag = node.tag
+            if tag == 'h3':
+                if title is None and 'card-title' in (node.attributes.get('class') or '').split():
+                    title = node.text(strip=True)
+            elif tag == 'p':
+                if description is None and 'card-text' in (node.attributes.get('class') or '').split():
+                    description = node.text(strip=True)
+            elif tag == 'a':
+                if url is None:
+                    href = node.attributes.get('href')
+                    if href:
+                        url = self._absolute_url(href)
+            elif tag == 'span':
+                if timestamp is None and 'date' in (node.attributes.get('class') or '').split():
+                    timestamp = node.text(strip=True)
+
+        return {
+            'title': title or "N/A",
+            'description': description or "N/A",
+            'url': url,
+            'timestamp': timestamp or "N/A",
+        }
         
-    def scrape_search_results(self, query: str, pages: int = 1) -> List[Dict[str, Any]]:
+    def open_sink(self, path: str) -> BinaryIO:
+        """Open an append-only JSONL sink for streaming records.
+
+        Records written to the sink survive a crashed run, and re-running
+        with the same path resumes by appending.
+
+        Args:
+            path: Path of the JSONL file to append to
+
+        Returns:
+            Binary file handle opened for appending
+        """
+        return open(path, 'ab')
+
+    @staticmethod
+    def _write_record(sink: BinaryIO, record: Dict[str, Any]) -> None:
+        """Append one record to a JSONL sink.
+
+        Args:
+            sink: Binary file handle opened for appending
+            record: Record to append
+        """
+        sink.write(orjson.dumps(record) + b'\n')
+        sink.flush()
+
+    def scrape_search_results(self, query: str, pages: int = 1,
+                              fetch_details: bool = False,
+                              sink: Optional[BinaryIO] = None) -> List[Dict[str, Any]]:
         """Scrape search results for a given query.
-        
+
         Args:
             query: Search query
             pages: Number of pages to scrape
-            
+            fetch_details: Also fetch each result's service details page
+            sink: Optional JSONL sink; each result is appended as soon as
+                it is complete
+
         Returns:
             List of dictionaries containing search results
         """
-        all_results = []
-        
-        for page in range(1, pages + 1):
-            url = f"/search?q={query}&page={page}"
-            soup = self.get_page(url)
-            
-            if not soup:
-                break
-                
-            # Example: Extract search results from the page
-            result_items = soup.select('div.search-result')  # Adjust selector based on actual HTML
-            
-            if not result_items:
+        return asyncio.run(self._scrape_search_results(query, pages, fetch_details, sink))
+
+    async def _scrape_search_results(self, query: str, pages: int,
+                                     fetch_details: bool = False,
+                                     sink: Optional[BinaryIO] = None) -> List[Dict[str, Any]]:
+        """Fetch and parse all search result pages on one event loop.
+
+        Args:
+            query: Search query
+            pages: Number of pages to scrape
+            fetch_details: Also fetch each result's service details page
+            sink: Optional JSONL sink; each result is appended as soon as
+                it is complete
+
+        Returns:
+            List of dictionaries containing search results, in page order
+        """
+        if rusty_req is not None:
+            return await self._scrape_search_results_rust(query, pages, fetch_details, sink)
+
+        # All page fetches are in flight at once on a single thread; the
+        # connector keeps the sockets alive between requests.
+        connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=75)
+        # Build the invariant part of the search URL once
+        search_base = f"/search?q={quote(query)}&page="
+        async with aiohttp.ClientSession(connector=connector) as session:
+            page_tasks = [
+                asyncio.create_task(self._afetch_search_page(session, search_base + str(page)))
+                for page in range(1, pages + 1)
+            ]
+
+            all_results = []
+            detail_tasks = []
+
+            for page, task in enumerate(page_tasks, start=1):
+                results = await task
+                if not results:
+                    print(f"No results found on page {page}")
+                    continue
+
+                # Kick off detail fetches as soon as a page is parsed so
+                # their round trips overlap the remaining page fetches.
+                # Records go to the sink once final: immediately, or after
+                # their detail fetch completes.
+                if fetch_details:
+                    for result in results:
+                        if result['url']:
+                            detail_tasks.append(asyncio.create_task(
+                                self._fetch_service_details(session, result, sink)))
+                        elif sink:
+                            self._write_record(sink, result)
+                elif sink:
+                    for result in results:
+                        self._write_record(sink, result)
+
+                all_results.extend(results)
+
+            if detail_tasks:
+                await asyncio.gather(*detail_tasks)
+
+        return all_results
+
+    async def _scrape_search_results_rust(self, query: str, pages: int,
+                                          fetch_details: bool = False,
+                                          sink: Optional[BinaryIO] = None) -> List[Dict[str, Any]]:
+        """Batch-fetch and parse search result pages with rusty-req.
+
+        The Rust client handles DNS, TLS, keep-alive, decompression and
+        concurrency on a shared reqwest/tokio runtime; Python only parses
+        the returned bodies.
+
+        Args:
+            query: Search query
+            pages: Number of pages to scrape
+            fetch_details: Also fetch each result's service details page
+            sink: Optional JSONL sink; each result is appended as soon as
+                it is complete
+
+        Returns:
+            List of dictionaries containing search results, in page order
+        """
+        search_base = f"/search?q={quote(query)}&page="
+        specs = [
+            rusty_req.RequestItem(url=urljoin(self.base_url, search_base + str(page)),
+                                  method='GET', headers=self.headers,
+                                  timeout=10.0, tag=str(page))
+            for page in range(1, pages + 1)
+        ]
+
+        print(f"Fetching {len(specs)} search page(s)...")
+        responses = await self._fetch_batches(specs)
+
+        page_results: Dict[int, List[Dict[str, Any]]] = {}
+        for item in responses:
+            page = int(item['meta']['tag'])
+            content = self._rusty_body(item)
+            if content is None:
+                print(f"Failed to fetch search page {page}")
+                continue
+
+            results = self._extract_results(content)
+            if not results:
                 print(f"No results found on page {page}")
-                break
-                
-            for item in result_items:
-                try:
-                    # These selectors are examples - you'll need to adjust based on actual HTML
-                    result_data = {
-                        'title': item.select_one('h4.result-title').text.strip() if item.select_one('h4.result-title') else "N/A",
-                        'description': item.select_one('div.result-description').text.strip() if item.select_one('div.result-description') else "N/A",
-                        'url': urljoin(self.base_url, item.select_one('a')['href']) if item.select_one('a') else None,
-                        'details': self._extract_details(item),
-                    }
-                    
-                    all_results.append(result_data)
-                    
-                except Exception as e:
-                    print(f"Error parsing result item: {e}")
-            
-            # Be respectful of the website and avoid getting blocked
-            if page < pages:
-                sleep_time = random.uniform(2, 5)
-                print(f"Waiting {sleep_time:.2f} seconds before fetching next page...")
-                time.sleep(sleep_time)
-        
+                continue
+
+            page_results[page] = results
+
+            # Records are final right here unless a detail fetch will
+            # still extend them; stream those to the sink now
+            if sink:
+                for result in results:
+                    if not fetch_details or not result['url']:
+                        self._write_record(sink, result)
+
+        # Reassemble in page order regardless of completion order
+        all_results = []
+        for page in sorted(page_results):
+            all_results.extend(page_results[page])
+
+        if fetch_details:
+            pending = [result for result in all_results if result['url']]
+            specs = [
+                rusty_req.RequestItem(url=result['url'], method='GET',
+                                      headers=self.headers, timeout=10.0, tag=str(i))
+                for i, result in enumerate(pending)
+            ]
+
+            print(f"Fetching {len(specs)} details page(s)...")
+            responses = await self._fetch_batches(specs)
+
+            for item in responses:
+                result = pending[int(item['meta']['tag'])]
+                content = self._rusty_body(item)
+                if content is not None:
+                    result['details'].update(
+                        self._parse_service_details(content, parser=self._UTF8_HTML))
+                # Complete (or failed-detail) record: stream it out
+                if sink:
+                    self._write_record(sink, result)
+
         return all_results
-    
-    def _extract_details(self, element: BeautifulSoup) -> Dict[str, str]:
-        """Extract detailed information from a result element.
-        
+
+    async def _fetch_batches(self, specs: List[Any]) -> List[Dict[str, Any]]:
+        """Dispatch request specs in politeness-sized sub-batches.
+
+        At most bucket.capacity requests go out concurrently, one token
+        acquired per request, so the Rust batches honor the same burst cap
+        as the per-request aiohttp path instead of firing the whole batch
+        at once after a long pre-wait.
+
         Args:
-            element: BeautifulSoup element containing details
-            
+            specs: rusty-req RequestItem specs to dispatch
+
+        Returns:
+            Combined fetch_requests result entries for all sub-batches
+        """
+        responses = []
+        batch_size = max(1, int(self.bucket.capacity))
+
+        for start in range(0, len(specs), batch_size):
+            batch = specs[start:start + batch_size]
+            for _ in batch:
+                await self.bucket.acquire_async()
+            responses.extend(await rusty_req.fetch_requests(
+                requests=batch, total_timeout=60.0,
+                mode=rusty_req.ConcurrencyMode.SELECT_ALL))
+
+        return responses
+
+    @staticmethod
+    def _rusty_body(item: Dict[str, Any]) -> Optional[bytes]:
+        """Pull the body out of one rusty-req batch response entry.
+
+        Args:
+            item: One entry of the fetch_requests result list
+
+        Returns:
+            Body bytes, or None if the request failed
+        """
+        if item.get('http_status') != 200 or item.get('exception'):
+            return None
+
+        payload = item.get('response')
+        if not payload:
+            return None
+
+        content = orjson.loads(payload).get('content')
+        return content.encode('utf-8') if content else None
+
+    def _extract_results(self, content: bytes) -> List[Dict[str, Any]]:
+        """Extract all search results from a full results page body.
+
+        Args:
+            content: Raw HTML bytes of the search results page
+
+        Returns:
+            List of dictionaries containing search results
+        """
+        tree = lxml.html.fromstring(content, parser=self._UTF8_HTML)
+        return [self._extract_result(elem) for elem in self._X_RESULTS(tree)]
+
+    async def _fetch_service_details(self, session: aiohttp.ClientSession,
+                                     result: Dict[str, Any],
+                                     sink: Optional[BinaryIO] = None) -> None:
+        """Fetch a result's details page and merge its fields in place.
+
+        Args:
+            session: Shared aiohttp client session
+            result: Search result dictionary with a 'url' to fetch
+            sink: Optional JSONL sink to append the completed record to
+        """
+        fetched = await self.aget_content(session, result['url'])
+        if fetched:
+            content, encoding = fetched
+            result['details'].update(self._parse_service_details(
+                content, parser=self._html_parser_for(encoding)))
+        if sink:
+            self._write_record(sink, result)
+
+    async def _afetch_search_page(self, session: aiohttp.ClientSession,
+                                  url: str) -> List[Dict[str, Any]]:
+        """Fetch a search results page and extract results as it streams in.
+
+        Response chunks are fed to lxml's HTMLPullParser as they arrive;
+        each search-result <div> is extracted the moment its close tag is
+        parsed and then freed, so peak memory stays bounded even on very
+        large pages.
+
+        Args:
+            session: Shared aiohttp client session
+            url: The URL to fetch
+
+        Returns:
+            List of dictionaries containing search results
+        """
+        full_url = urljoin(self.base_url, url)
+        results = []
+
+        try:
+            await self.bucket.acquire_async()
+            print(f"Fetching {full_url}...")
+            async with session.get(full_url, headers=self.headers,
+                                   timeout=self._TIMEOUT) as response:
+                if response.status != 200:
+                    print(f"Failed to fetch {full_url}, status code: {response.status}")
+                    return results
+
+                # aiohttp resolves the Content-Type charset (UTF-8 when
+                # undeclared); without it libxml2 falls back to latin-1
+                parser = lxml.etree.HTMLPullParser(events=('end',),
+                                                   encoding=response.get_encoding())
+                try:
+                    async for chunk in response.content.iter_chunked(8192):
+                        parser.feed(chunk)
+                        self._drain_results(parser, results)
+                finally:
+                    # Flush events still buffered at end of stream (optional
+                    # end tags, truncated bodies) and salvage results already
+                    # parsed when a mid-stream error fires
+                    try:
+                        parser.close()
+                    except lxml.etree.XMLSyntaxError:
+                        pass
+                    self._drain_results(parser, results)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching {full_url}: {e}")
+
+        return results
+
+    def _drain_results(self, parser: lxml.etree.HTMLPullParser,
+                       results: List[Dict[str, Any]]) -> None:
+        """Extract finished search-result divs from pending parser events.
+
+        Args:
+            parser: Pull parser being fed the page stream
+            results: List the extracted results are appended to
+        """
+        for _, elem in parser.read_events():
+            if elem.tag == 'div' and 'search-result' in (elem.get('class') or '').split():
+                results.append(self._extract_result(elem))
+                # Free the extracted result and everything parsed before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+    def _extract_result(self, elem: lxml.etree._Element) -> Dict[str, Any]:
+        """Extract one search result from its lxml element.
+
+        Args:
+            elem: The search-result <div> element
+
         Returns:
-            Dictionary of detail key-value pairs
+            Dictionary containing the search result
         """
+        title = self._X_RESULT_TITLE(elem).strip()
+        description = self._X_RESULT_DESC(elem).strip()
+        href = self._X_RESULT_HREF(elem)
+
         details = {}
-        
-        # Example: Extract key-value pairs from result details
-        detail_elements = element.select('div.detail-item')  # Adjust selector based on actual HTML
-        
-        for detail in detail_elements:
-            try:
-                key_elem = detail.select_one('span.detail-key')
-                value_elem = detail.select_one('span.detail-value')
-                
-                if key_elem and value_elem:
-                    key = key_elem.text.strip()
-                    value = value_elem.text.strip()
-                    details[key] = value
-                    
-            except Exception as e:
-                print(f"Error extracting detail: {e}")
-                
-        return details
-    
+        for detail in self._X_DETAIL_ITEMS(elem):
+            key = self._X_DETAIL_KEY(detail).strip()
+            value = self._X_DETAIL_VALUE(detail).strip()
+            if key and value:
+                details[key] = value
+
+        return {
+            'title': title or "N/A",
+            'description': description or "N/A",
+            'url': self._absolute_url(href) if href else None,
+            'details': details,
+        }
+
+
     def scrape_service_details(self, service_url: str) -> Dict[str, Any]:
         """Scrape detailed information about a specific service.
         
@@ -178,58 +703,121 @@ class WebsiteScraper:
         Returns:
             Dictionary containing service details
         """
-        soup = self.get_page(service_url)
-        if not soup:
+        fetched = self.get_content(service_url)
+        if not fetched:
             return {}
-            
+
+        content, encoding = fetched
+        details = {'url': service_url}
+        details.update(self._parse_service_details(
+            content, parser=self._html_parser_for(encoding)))
+        return details
+
+    def _parse_service_details(self, content: bytes,
+                               parser: Optional[lxml.html.HTMLParser] = None) -> Dict[str, Any]:
+        """Extract service details from a details page.
+
+        Parses with lxml.html directly; the title and the info-table
+        key/value cells each come out of a single XPath evaluation in C
+        instead of per-row selector calls.
+
+        Args:
+            content: Raw HTML bytes of the service details page
+            parser: Optional parser with a fixed encoding; by default
+                libxml2 detects the encoding from the raw bytes
+
+        Returns:
+            Dictionary containing service details
+        """
+        tree = lxml.html.fromstring(content, parser=parser)
+
         # Example: Extract service details
         details = {
-            'url': service_url,
-            'title': soup.select_one('h1.service-title').text.strip() if soup.select_one('h1.service-title') else "N/A",
+            'title': self._X_SERVICE_TITLE(tree).strip() or "N/A",
         }
-        
-        # Example: Extract additional information
-        info_table = soup.select_one('table.info-table')
-        if info_table:
-            rows = info_table.select('tr')
-            for row in rows:
-                cells = row.select('td')
-                if len(cells) >= 2:
-                    key = cells[0].text.strip()
-                    value = cells[1].text.strip()
-                    details[key] = value
-        
+
+        # Example: Extract additional information - one traversal returns the
+        # first two cells of every info-table row that has at least two
+        cells = self._X_INFO_CELLS(tree)
+        pairs = iter(cells)
+        for key_cell, value_cell in zip(pairs, pairs):
+            details[key_cell.text_content().strip()] = value_cell.text_content().strip()
+
         return details
     
-    def save_to_csv(self, data: List[Dict[Any, Any]], filename: str) -> None:
+    def save_to_csv(self, data: Iterable[Dict[Any, Any]], filename: str) -> None:
         """Save data to a CSV file.
-        
+
+        Records are written as they stream in, so the whole data set never
+        needs to be held in memory. Column names come from the first record.
+
         Args:
-            data: List of dictionaries containing scraped data
+            data: Iterable of dictionaries containing scraped data
             filename: Output filename
         """
-        if not data:
+        records = iter(data)
+        try:
+            first = next(records)
+        except StopIteration:
             print(f"No data to save to {filename}")
             return
-            
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
-        print(f"Saved {len(data)} items to {filename}")
-        
-    def save_to_json(self, data: List[Dict[Any, Any]], filename: str) -> None:
+
+        count = 1
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(first.keys()),
+                                    extrasaction='ignore', restval='')
+            writer.writeheader()
+            writer.writerow(first)
+            for record in records:
+                writer.writerow(record)
+                count += 1
+
+        print(f"Saved {count} items to {filename}")
+
+    def save_to_json(self, data: Iterable[Dict[Any, Any]], filename: str) -> None:
         """Save data to a JSON file.
-        
+
+        Records are encoded and written one at a time as a JSON array, so
+        the whole data set never needs to be held in memory.
+
         Args:
-            data: List of dictionaries containing scraped data
+            data: Iterable of dictionaries containing scraped data
             filename: Output filename
         """
-        if not data:
+        records = iter(data)
+        try:
+            first = next(records)
+        except StopIteration:
             print(f"No data to save to {filename}")
             return
-            
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        print(f"Saved {len(data)} items to {filename}")
+
+        # orjson encodes in Rust, straight to UTF-8 bytes
+        count = 1
+        with open(filename, 'wb') as f:
+            f.write(b'[\n')
+            f.write(orjson.dumps(first))
+            for record in records:
+                f.write(b',\n')
+                f.write(orjson.dumps(record))
+                count += 1
+            f.write(b'\n]\n')
+
+        print(f"Saved {count} items to {filename}")
+
+    def save_to_jsonl(self, data: Iterable[Dict[Any, Any]], filename: str) -> None:
+        """Append data to a JSONL file, one record per line.
+
+        Args:
+            data: Iterable of dictionaries containing scraped data
+            filename: Output filename
+        """
+        count = 0
+        with self.open_sink(filename) as sink:
+            for record in data:
+                self._write_record(sink, record)
+                count += 1
+
+        print(f"Appended {count} items to {filename}")
 
 def main():
     parser = argparse.ArgumentParser(description='Website Scraper for LeakIX.net')
@@ -238,14 +826,16 @@ def main():
     parser.add_argument('--query', '-q', type=str, help='Search query (for search mode)')
     parser.add_argument('--url', '-u', type=str, help='Service URL (for details mode)')
     parser.add_argument('--pages', '-p', type=int, default=1, help='Number of pages to scrape (for search mode)')
+    parser.add_argument('--details', '-d', action='store_true', help='Also fetch service details for each result (for search mode)')
     parser.add_argument('--output', '-o', type=str, default='scraped_data.json', help='Output file')
-    parser.add_argument('--format', '-f', type=str, choices=['csv', 'json'], default='json', help='Output format')
-    
+    parser.add_argument('--format', '-f', type=str, choices=['csv', 'json', 'jsonl'], default='json', help='Output format (jsonl appends records as they are scraped)')
+
     args = parser.parse_args()
-    
+
     # Initialize scraper
     scraper = WebsiteScraper("https://leakix.net")
-    
+    sink = None
+
     # Scrape based on mode
     if args.mode == 'home':
         print("Scraping LeakIX homepage...")
@@ -255,7 +845,11 @@ def main():
             print("Error: Search query required for search mode")
             return
         print(f"Searching LeakIX for '{args.query}' across {args.pages} page(s)...")
-        data = scraper.scrape_search_results(args.query, args.pages)
+        # Stream records to the sink as they are scraped, so a crashed run
+        # keeps everything fetched so far
+        if args.format == 'jsonl':
+            sink = scraper.open_sink(args.output)
+        data = scraper.scrape_search_results(args.query, args.pages, fetch_details=args.details, sink=sink)
     elif args.mode == 'details':
         if not args.url:
             print("Error: Service URL required for details mode")
@@ -267,8 +861,13 @@ def main():
         return
     
     # Save results
-    if args.format == 'csv':
+    if sink is not None:
+        sink.close()
+        print(f"Appended {len(data)} items to {args.output}")
+    elif args.format == 'csv':
         scraper.save_to_csv(data, args.output)
+    elif args.format == 'jsonl':
+        scraper.save_to_jsonl(data, args.output)
     else:
         scraper.save_to_json(data, args.output)
 
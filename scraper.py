@@ -1,31 +1,102 @@
 import tweepy
-import pandas as pd
+import csv
+import operator
 import time
 import datetime
-import json
+import orjson
 import argparse
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, List, Dict, Any, Optional
+
+class AdaptiveTokenBucket:
+    def __init__(self, rate: float = 0.2, capacity: float = 1.0,
+                 min_rate: float = 0.02, increase: float = 0.02,
+                 growth_cap: float = 1.5, decrease: float = 0.5):
+        """Initialize a token bucket whose refill rate adapts to API feedback.
+
+        The rate grows additively on each successful request and shrinks
+        multiplicatively on a 429, so throughput converges on the server's
+        actual quota instead of halting for fixed backoff periods.
+
+        Args:
+            rate: Initial token refill rate per second
+            capacity: Maximum number of tokens (allowed burst size)
+            min_rate: Floor the rate never drops below
+            increase: Additive rate increase per successful request
+            growth_cap: Multiplicative cap on per-step rate growth
+            decrease: Multiplicative rate reduction on rate limiting
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.increase = increase
+        self.growth_cap = growth_cap
+        self.decrease = decrease
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            time.sleep((1 - self.tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Grow the rate after a successful request."""
+        self.rate = min(self.rate + self.increase, self.rate * self.growth_cap)
+
+    def on_rate_limited(self) -> None:
+        """Back off after a 429: cut the rate and drain the bucket."""
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.tokens = 0
+        self.last_refill = time.monotonic()
+
 
 class TwitterScraper:
     def __init__(self, bearer_token: str):
         """Initialize the Twitter scraper with authentication credentials.
-        
+
         Args:
             bearer_token: Twitter API Bearer Token
         """
         self.client = tweepy.Client(bearer_token=bearer_token)
-        
-    def search_tweets(self, query: str, max_results: int = 100, 
+        self.bucket = AdaptiveTokenBucket()
+
+    def open_sink(self, path: str) -> BinaryIO:
+        """Open an append-only JSONL sink for streaming tweets.
+
+        Tweets written to the sink survive a crashed run, and re-running
+        with the same path resumes by appending.
+
+        Args:
+            path: Path of the JSONL file to append to
+
+        Returns:
+            Binary file handle opened for appending
+        """
+        return open(path, 'ab')
+
+    def search_tweets(self, query: str, max_results: int = 100,
                      start_time: Optional[datetime.datetime] = None,
-                     end_time: Optional[datetime.datetime] = None) -> List[Dict[Any, Any]]:
+                     end_time: Optional[datetime.datetime] = None,
+                     sink: Optional[BinaryIO] = None) -> List[Dict[Any, Any]]:
         """Search for tweets matching a query.
-        
+
         Args:
             query: The search query
             max_results: Maximum number of results to return (10-100)
             start_time: Optional start time for tweets
             end_time: Optional end time for tweets
-            
+            sink: Optional JSONL sink; each tweet is appended as soon as
+                it is processed
+
         Returns:
             List of tweet data dictionaries
         """
@@ -38,15 +109,19 @@ class TwitterScraper:
         
         # Limit single request to max 100 (API limit)
         request_size = min(max_results, 100)
+
+        # Fetch the constant attribute set in one call per tweet
+        tweet_getter = operator.attrgetter('id', 'text', 'created_at',
+                                           'public_metrics', 'lang', 'author_id')
         
-        # Handle rate limiting with exponential backoff
+        # Handle rate limiting with the adaptive token bucket
         max_retries = 5
         retry_count = 0
-        retry_delay = 60  # Start with 60 seconds
-        
+
         while retry_count <= max_retries:
             try:
                 # Make the API request
+                self.bucket.acquire()
                 response = self.client.search_recent_tweets(
                     query=query,
                     max_results=request_size,
@@ -56,7 +131,8 @@ class TwitterScraper:
                     start_time=start_time,
                     end_time=end_time
                 )
-                
+                self.bucket.on_success()
+
                 if not response.data:
                     print("No tweets found matching the query.")
                     break
@@ -66,26 +142,31 @@ class TwitterScraper:
                 
                 # Process each tweet
                 for tweet in response.data:
+                    tweet_id, text, created_at, metrics, lang, author_id = tweet_getter(tweet)
                     tweet_data = {
-                        'id': tweet.id,
-                        'text': tweet.text,
-                        'created_at': tweet.created_at,
-                        'retweet_count': tweet.public_metrics['retweet_count'],
-                        'reply_count': tweet.public_metrics['reply_count'],
-                        'like_count': tweet.public_metrics['like_count'],
-                        'quote_count': tweet.public_metrics['quote_count'],
-                        'lang': tweet.lang
+                        'id': tweet_id,
+                        'text': text,
+                        'created_at': created_at,
+                        'retweet_count': metrics['retweet_count'],
+                        'reply_count': metrics['reply_count'],
+                        'like_count': metrics['like_count'],
+                        'quote_count': metrics['quote_count'],
+                        'lang': lang
                     }
-                    
+
                     # Add author information if available
-                    if tweet.author_id in users:
-                        user = users[tweet.author_id]
+                    user = users.get(author_id)
+                    if user is not None:
                         tweet_data['author_id'] = user.id
                         tweet_data['author_name'] = user.name
                         tweet_data['author_username'] = user.username
                         tweet_data['author_location'] = user.location
                         tweet_data['author_verified'] = user.verified
-                    
+
+                    if sink:
+                        sink.write(orjson.dumps(tweet_data, option=orjson.OPT_NON_STR_KEYS) + b'\n')
+                        sink.flush()
+
                     tweets.append(tweet_data)
                 
                 # Successfully retrieved tweets, break out of retry loop
@@ -93,9 +174,10 @@ class TwitterScraper:
                     
             except tweepy.TooManyRequests:
                 if retry_count < max_retries:
-                    print(f"Rate limit exceeded. Waiting {retry_delay} seconds before retrying...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+                    # Cut the request rate and retry; the next acquire()
+                    # waits only as long as the reduced rate requires
+                    self.bucket.on_rate_limited()
+                    print(f"Rate limit exceeded. Reducing request rate to {self.bucket.rate:.3f}/s and retrying...")
                     retry_count += 1
                 else:
                     print("Maximum retry attempts reached. Could not complete the request due to rate limiting.")
@@ -117,9 +199,16 @@ class TwitterScraper:
         if not tweets:
             print(f"No tweets to save to {filename}")
             return
-            
-        df = pd.DataFrame(tweets)
-        df.to_csv(filename, index=False)
+
+        # Columns are the union of keys across tweets, in first-seen order
+        # (author fields are only present when the author was resolved)
+        fieldnames = list(dict.fromkeys(key for tweet in tweets for key in tweet))
+
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+            writer.writeheader()
+            writer.writerows(tweets)
+
         print(f"Saved {len(tweets)} tweets to {filename}")
         
     def save_to_json(self, tweets: List[Dict[Any, Any]], filename: str) -> None:
@@ -133,8 +222,10 @@ class TwitterScraper:
             print(f"No tweets to save to {filename}")
             return
             
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(tweets, f, ensure_ascii=False, indent=4, default=str)
+        # orjson encodes in Rust and serializes created_at datetimes
+        # natively, so no default=str hack is needed
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(tweets, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         print(f"Saved {len(tweets)} tweets to {filename}")
 
 def main():
@@ -143,7 +234,7 @@ def main():
     parser.add_argument('--query', '-q', type=str, required=True, help='Search query')
     parser.add_argument('--count', '-c', type=int, default=100, help='Number of tweets to retrieve (max 100)')
     parser.add_argument('--output', '-o', type=str, default='tweets.csv', help='Output file')
-    parser.add_argument('--format', '-f', type=str, choices=['csv', 'json'], default='csv', help='Output format')
+    parser.add_argument('--format', '-f', type=str, choices=['csv', 'json', 'jsonl'], default='csv', help='Output format (jsonl appends tweets as they are retrieved)')
     parser.add_argument('--days', '-d', type=int, default=7, help='Number of days back to search (max 7)')
     
     args = parser.parse_args()
@@ -161,19 +252,27 @@ def main():
     # Initialize scraper
     scraper = TwitterScraper(args.token)
     
+    # Stream tweets to the sink as they are retrieved, so a crashed run
+    # keeps everything fetched so far
+    sink = scraper.open_sink(args.output) if args.format == 'jsonl' else None
+
     # Search for tweets
     print(f"Searching for tweets matching '{args.query}'...")
     tweets = scraper.search_tweets(
         query=args.query,
         max_results=args.count,
         start_time=start_time,
-        end_time=end_time
+        end_time=end_time,
+        sink=sink
     )
-    
+
     print(f"Retrieved {len(tweets)} tweets")
-    
+
     # Save results
-    if args.format == 'csv':
+    if sink is not None:
+        sink.close()
+        print(f"Appended {len(tweets)} tweets to {args.output}")
+    elif args.format == 'csv':
         scraper.save_to_csv(tweets, args.output)
     else:
         scraper.save_to_json(tweets, args.output)